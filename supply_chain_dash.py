@@ -1,3 +1,6 @@
+import os
+from typing import NamedTuple
+
 import streamlit as st
 import pandas as pd
 import plotly.express as px
@@ -5,6 +8,23 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import numpy as np
 
+# Shared chart color sequences and layouts
+COLORS_SET2 = px.colors.qualitative.Set2
+COLORS_PASTEL = px.colors.qualitative.Pastel
+COLORS_SET3 = px.colors.qualitative.Set3
+COLORS_BOLD = px.colors.qualitative.Bold
+COLORS_VIVID = px.colors.qualitative.Vivid
+COLORS_SAFE = px.colors.qualitative.Safe
+COLORS_ALPHABET = px.colors.qualitative.Alphabet
+COLORS_PRISM = px.colors.qualitative.Prism
+COLORS_DARK2 = px.colors.qualitative.Dark2
+COLORS_PASTEL1 = px.colors.qualitative.Pastel1
+COLORS_SET1 = px.colors.qualitative.Set1
+LAYOUT_400 = dict(height=400)
+LAYOUT_400_NO_LEGEND = dict(height=400, showlegend=False)
+LAYOUT_450 = dict(height=450)
+LAYOUT_450_NO_LEGEND = dict(height=450, showlegend=False)
+
 # Page configuration
 st.set_page_config(
     page_title="Supply Chain Dashboard",
@@ -34,23 +54,62 @@ st.markdown("""
     """, unsafe_allow_html=True)
 
 # Load data
-@st.cache_data
-def load_data():
-    df = pd.read_csv('supply_chain_data.csv')
+DATA_CSV = 'supply_chain_data.csv'
+# Bump the version whenever build_parquet changes its output, so stale copies are not reused
+DATA_PARQUET_VERSION = 3
+DATA_PARQUET = f'supply_chain_data.v{DATA_PARQUET_VERSION}.parquet'
+CATEGORY_COLS = ['Product Type', 'Location', 'Transportation modes', 'Routes', 'Shipping carriers',
+                 'Supplier name', 'Inspection results', 'Customer demographics']
+NUMERIC_COLS = ['Price', 'Availability', 'Number of products sold', 'Revenue generated',
+                'Stock levels', 'Lead times', 'Order quantities', 'Shipping times',
+                'Production volumes', 'Manufacturing lead time', 'Defect rates']
+BLOCK_COLS = NUMERIC_COLS + ['Shipping costs', 'Manufacturing costs', 'Costs']
+RADAR_COLS = ['Price', 'Stock levels', 'Lead times', 'Defect rates', 'Shipping times']
 
-    # Clean currency columns
-    def clean_currency(value):
-        if isinstance(value, str):
-            return float(value.replace('$', '').replace(',', ''))
-        return value
 
+def build_parquet():
+    # One-time conversion of the raw CSV into a cleaned, typed Parquet file
+    df = pd.read_csv(DATA_CSV, engine='pyarrow')
+
+    # Clean currency columns
     currency_cols = ['Price', 'Revenue generated', 'Shipping costs', 'Manufacturing costs', 'Costs']
     for col in currency_cols:
-        df[col] = df[col].apply(clean_currency)
-
+        if not pd.api.types.is_numeric_dtype(df[col]):
+            df[col] = df[col].str.replace(r'[\$,]', '', regex=True)
+        df[col] = df[col].astype(float)
+
+    # Low-cardinality text columns filter and group on integer codes
+    for col in CATEGORY_COLS:
+        df[col] = df[col].astype('category')
+
+    # Write beside the target and swap it in, so an interrupted write never leaves a truncated copy
+    tmp_path = f'{DATA_PARQUET}.{os.getpid()}.tmp'
+    try:
+        df.to_parquet(tmp_path, engine='pyarrow', compression='zstd')
+        os.replace(tmp_path, DATA_PARQUET)
+    except OSError:
+        # Read-only directory: serve the cleaned frame from memory instead
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
     return df
 
-df = load_data()
+
+# Read-only reference data shared by every session without per-session copies
+@st.cache_resource
+def load_data():
+    # Rebuild the Parquet copy on first run or when the CSV has changed since it was written
+    if not os.path.exists(DATA_PARQUET) or os.path.getmtime(DATA_PARQUET) < os.path.getmtime(DATA_CSV):
+        df = build_parquet()
+    else:
+        df = pd.read_parquet(DATA_PARQUET)
+
+    # Row-major float32 copy of the numeric columns for mask-and-reduce work
+    numeric_block = np.ascontiguousarray(df[BLOCK_COLS].to_numpy(dtype=np.float32))
+    numeric_block.flags.writeable = False
+    col_idx = {col: idx for idx, col in enumerate(BLOCK_COLS)}
+    return df, numeric_block, col_idx
+
+df, numeric_block, col_idx = load_data()
 
 # Title and description
 st.title("📦 Supply Chain Analytics Dashboard")
@@ -60,52 +119,284 @@ st.markdown("---")
 st.sidebar.header("🔍 Filters")
 selected_product_type = st.sidebar.multiselect(
     "Product Type",
-    options=df['Product Type'].unique(),
-    default=df['Product Type'].unique()
+    options=list(df['Product Type'].unique()),
+    default=list(df['Product Type'].unique())
 )
 
 selected_location = st.sidebar.multiselect(
     "Location",
-    options=df['Location'].unique(),
-    default=df['Location'].unique()
+    options=list(df['Location'].unique()),
+    default=list(df['Location'].unique())
 )
 
 selected_transport = st.sidebar.multiselect(
     "Transportation Mode",
-    options=df['Transportation modes'].unique(),
-    default=df['Transportation modes'].unique()
+    options=list(df['Transportation modes'].unique()),
+    default=list(df['Transportation modes'].unique())
+)
+
+# Filter selections as hashable cache keys
+filters = (
+    tuple(sorted(selected_product_type)),
+    tuple(sorted(selected_location)),
+    tuple(sorted(selected_transport))
 )
 
+
 # Filter data
-df_filtered = df[
-    (df['Product Type'].isin(selected_product_type)) &
-    (df['Location'].isin(selected_location)) &
-    (df['Transportation modes'].isin(selected_transport))
-]
+def category_mask(col, values):
+    # Match on the categorical codes with a lookup table instead of comparing strings
+    codes = df[col].cat.categories.get_indexer(list(values))
+    codes = codes[codes >= 0]
+    if len(codes) == 0:
+        return np.zeros(len(df), dtype=bool)
+    return np.isin(df[col].cat.codes.to_numpy(), codes, kind='table')
+
+
+@st.cache_data
+def get_mask(product_types, locations, transports):
+    mask = category_mask('Product Type', product_types)
+    mask &= category_mask('Location', locations)
+    mask &= category_mask('Transportation modes', transports)
+    return mask
+
+
+@st.cache_data
+def get_filtered(*filters):
+    return df[get_mask(*filters)]
+
+
+# Cached aggregations, keyed on the filter selections
+class Summary(NamedTuple):
+    count: int
+    sums: np.ndarray
+    means: np.ndarray
+    maxs: np.ndarray
+    pass_rate: float
+    fail_rate: float
+
+
+@st.cache_data
+def compute_summary(*filters):
+    # One sweep over the masked block for every column's sum, mean and max
+    mask = get_mask(*filters)
+    block = numeric_block[mask]
+    count = len(block)
+    sums = block.sum(axis=0, dtype=np.float64)
+    empty = np.full(len(BLOCK_COLS), np.nan, dtype=np.float32)
+    means = sums / count if count else empty
+    maxs = block.max(axis=0) if count else empty
+
+    inspection = df['Inspection results']
+    codes = inspection.cat.codes.to_numpy()[mask]
+    counts = np.bincount(codes[codes >= 0], minlength=len(inspection.cat.categories))
+    inspection_counts = dict(zip(inspection.cat.categories, counts))
+    return Summary(
+        count=count,
+        sums=sums,
+        means=means,
+        maxs=maxs,
+        pass_rate=inspection_counts.get('Pass', 0) / count * 100 if count else np.nan,
+        fail_rate=inspection_counts.get('Fail', 0) / count * 100 if count else np.nan
+    )
+
+
+class KPIs(NamedTuple):
+    total_revenue: float
+    total_products_sold: int
+    avg_defect_rate: float
+    avg_lead_time: float
+    total_shipping_cost: float
+
+
+@st.cache_data
+def compute_kpis(*filters):
+    summary = compute_summary(*filters)
+    return KPIs(
+        total_revenue=summary.sums[col_idx['Revenue generated']],
+        total_products_sold=int(summary.sums[col_idx['Number of products sold']]),
+        avg_defect_rate=summary.means[col_idx['Defect rates']],
+        avg_lead_time=summary.means[col_idx['Lead times']],
+        total_shipping_cost=summary.sums[col_idx['Shipping costs']]
+    )
+
+
+@st.cache_data
+def get_by_product(*filters):
+    # One groupby per key feeds every Product Type chart
+    return get_filtered(*filters).groupby('Product Type', observed=True).agg({
+        'Revenue generated': 'sum',
+        'Price': 'mean',
+        'Stock levels': 'mean',
+        'Lead times': 'mean',
+        'Defect rates': 'mean',
+        'Shipping times': 'mean'
+    }).reset_index()
+
+
+@st.cache_data
+def get_revenue_by_product(*filters):
+    return get_by_product(*filters)[['Product Type', 'Revenue generated']]
+
+
+@st.cache_data
+def get_products_by_location(*filters):
+    products_by_location = get_filtered(*filters).groupby('Location', observed=True)['Number of products sold'].sum().reset_index()
+    return products_by_location.sort_values('Number of products sold')
+
+
+def category_counts(df_filtered, col, label):
+    # Count rows per category with a bincount over the codes, dropping empty categories.
+    # Ties keep their order of first appearance, matching value_counts.
+    values = df_filtered[col]
+    codes = values.cat.codes.to_numpy()
+    codes = codes[codes >= 0]
+    n_categories = len(values.cat.categories)
+    counts = np.bincount(codes, minlength=n_categories)
+    first_seen = np.full(n_categories, len(codes))
+    np.minimum.at(first_seen, codes, np.arange(len(codes)))
+    order = np.lexsort((first_seen, -counts))
+    order = order[counts[order] > 0]
+    return pd.DataFrame({label: values.cat.categories[order], 'Count': counts[order]})
+
+
+@st.cache_data
+def get_transport_dist(*filters):
+    return category_counts(get_filtered(*filters), 'Transportation modes', 'Transportation modes')
+
+
+@st.cache_data
+def get_shipping_by_route(*filters):
+    return get_filtered(*filters).groupby('Routes', observed=True)['Shipping costs'].sum().reset_index()
+
+
+@st.cache_data
+def get_avg_shipping_time(*filters):
+    avg_shipping_time = get_filtered(*filters).groupby('Shipping carriers', observed=True)['Shipping times'].mean().reset_index()
+    return avg_shipping_time.sort_values('Shipping times', ascending=False)
+
+
+@st.cache_data
+def get_production_location(*filters):
+    return get_filtered(*filters).groupby(['Location', 'Product Type'], observed=True)['Production volumes'].sum().reset_index()
+
+
+@st.cache_data
+def get_inspection_counts(*filters):
+    return category_counts(get_filtered(*filters), 'Inspection results', 'Inspection results')
+
+
+@st.cache_data
+def get_lead_time_fits(*filters):
+    # Closed-form least-squares line of order quantities on lead times per location
+    fits = []
+    for location, group in get_filtered(*filters).groupby('Location', observed=True):
+        x = group['Lead times'].to_numpy(dtype=np.float64)
+        y = group['Order quantities'].to_numpy(dtype=np.float64)
+        if len(x) < 2 or x.min() == x.max():
+            continue
+        slope, intercept = np.polyfit(x, y, 1)
+        xs = np.array([x.min(), x.max()])
+        fits.append((str(location), xs, slope * xs + intercept))
+    return fits
+
+
+@st.cache_data
+def get_top_products(*filters):
+    df_filtered = get_filtered(*filters)
+    # Partition out the tenth-largest revenue in O(N), then sort only the rows above it.
+    # Ties at the cutoff keep the earliest rows and a stable sort keeps their order, as nlargest did.
+    rev = df_filtered['Revenue generated'].to_numpy()
+    if len(rev) > 10:
+        kth = np.partition(rev, -10)[-10]
+        above = np.flatnonzero(rev > kth)
+        ties = np.flatnonzero(rev == kth)[:10 - len(above)]
+        df_filtered = df_filtered.iloc[np.sort(np.concatenate([above, ties]))]
+    top_products = df_filtered.sort_values('Revenue generated', ascending=False, kind='stable')
+    # Hierarchy charts build their parent labels with plain strings
+    return top_products.astype({'Product Type': str})
+
+
+@st.cache_data
+def get_costs_by_transport(*filters):
+    return get_filtered(*filters).groupby(['Transportation modes', 'Routes'], observed=True).agg({
+        'Costs': 'sum',
+        'Shipping costs': 'sum'
+    }).reset_index().astype({'Transportation modes': str, 'Routes': str})
+
+
+@st.cache_data
+def get_cost_data(*filters):
+    cost_idx = [col_idx['Manufacturing costs'], col_idx['Shipping costs'], col_idx['Costs']]
+    return pd.DataFrame({
+        'Category': ['Manufacturing', 'Shipping', 'Transportation'],
+        'Total Cost': numeric_block[get_mask(*filters)][:, cost_idx].sum(axis=0, dtype=np.float64)
+    })
+
+
+@st.cache_data
+def get_correlation_matrix(*filters):
+    # Pearson correlation as one float32 GEMM over the standardized block
+    X = numeric_block[get_mask(*filters)][:, [col_idx[col] for col in NUMERIC_COLS]]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        Xc = X - X.mean(axis=0)
+        Xs = Xc / Xc.std(axis=0)
+        return (Xs.T @ Xs) / len(Xs)
+
+
+@st.cache_data
+def get_metrics_by_product(*filters):
+    metrics_by_product = get_by_product(*filters)[['Product Type'] + RADAR_COLS].copy()
+
+    # Min-max normalize every metric column to 0-100 for radar chart
+    M = metrics_by_product[RADAR_COLS].to_numpy(dtype=np.float32)
+    M_min = M.min(axis=0, initial=np.inf)
+    M_max = M.max(axis=0, initial=-np.inf)
+    metrics_by_product[RADAR_COLS] = (M - M_min) / (M_max - M_min + 1e-12) * 100
+
+    return metrics_by_product
+
+
+@st.cache_data
+def get_supplier_metrics(*filters):
+    return get_filtered(*filters).groupby('Supplier name', observed=True).agg({
+        'Revenue generated': 'sum',
+        'Defect rates': 'mean',
+        'Number of products sold': 'sum'
+    }).reset_index()
+
+
+@st.cache_data
+def get_demographics_dist(*filters):
+    return category_counts(get_filtered(*filters), 'Customer demographics', 'Demographics')
+
+
+@st.cache_data
+def get_revenue_demographics(*filters):
+    return get_filtered(*filters).groupby('Customer demographics', observed=True)['Revenue generated'].sum().reset_index()
+
+
+df_filtered = get_filtered(*filters)
+kpis = compute_kpis(*filters)
 
 # Key Metrics Row
 st.header("📊 Key Performance Indicators")
 col1, col2, col3, col4, col5 = st.columns(5)
 
 with col1:
-    total_revenue = df_filtered['Revenue generated'].sum()
-    st.metric("Total Revenue", f"${total_revenue:,.2f}")
+    st.metric("Total Revenue", f"${kpis.total_revenue:,.2f}")
 
 with col2:
-    total_products_sold = df_filtered['Number of products sold'].sum()
-    st.metric("Products Sold", f"{total_products_sold:,}")
+    st.metric("Products Sold", f"{kpis.total_products_sold:,}")
 
 with col3:
-    avg_defect_rate = df_filtered['Defect rates'].mean()
-    st.metric("Avg Defect Rate", f"{avg_defect_rate:.2f}%")
+    st.metric("Avg Defect Rate", f"{kpis.avg_defect_rate:.2f}%")
 
 with col4:
-    avg_lead_time = df_filtered['Lead times'].mean()
-    st.metric("Avg Lead Time", f"{avg_lead_time:.1f} days")
+    st.metric("Avg Lead Time", f"{kpis.avg_lead_time:.1f} days")
 
 with col5:
-    total_shipping_cost = df_filtered['Shipping costs'].sum()
-    st.metric("Total Shipping Cost", f"${total_shipping_cost:,.2f}")
+    st.metric("Total Shipping Cost", f"${kpis.total_shipping_cost:,.2f}")
 
 st.markdown("---")
 
@@ -115,24 +406,25 @@ col1, col2 = st.columns(2)
 
 with col1:
     # Revenue by Product Type (Bar Chart)
-    revenue_by_product = df_filtered.groupby('Product Type')['Revenue generated'].sum().reset_index()
+    revenue_by_product = get_revenue_by_product(*filters)
+    revenue_by_product = revenue_by_product.astype({'Product Type': str})
     fig1 = px.bar(
         revenue_by_product,
         x='Product Type',
         y='Revenue generated',
         title='Revenue by Product Type',
         color='Product Type',
-        color_discrete_sequence=px.colors.qualitative.Set2,
+        color_discrete_sequence=COLORS_SET2,
         text='Revenue generated'
     )
     fig1.update_traces(texttemplate='$%{text:,.0f}', textposition='outside')
-    fig1.update_layout(showlegend=False, height=400)
+    fig1.update_layout(**LAYOUT_400_NO_LEGEND)
     st.plotly_chart(fig1, use_container_width=True)
 
 with col2:
     # Products Sold by Location (Horizontal Bar Chart)
-    products_by_location = df_filtered.groupby('Location')['Number of products sold'].sum().reset_index()
-    products_by_location = products_by_location.sort_values('Number of products sold')
+    products_by_location = get_products_by_location(*filters)
+    products_by_location = products_by_location.astype({'Location': str})
     fig2 = px.bar(
         products_by_location,
         y='Location',
@@ -144,7 +436,7 @@ with col2:
         text='Number of products sold'
     )
     fig2.update_traces(texttemplate='%{text:,}', textposition='outside')
-    fig2.update_layout(height=400)
+    fig2.update_layout(**LAYOUT_400)
     st.plotly_chart(fig2, use_container_width=True)
 
 # Row 2: Transportation and Logistics
@@ -153,39 +445,38 @@ col1, col2, col3 = st.columns(3)
 
 with col1:
     # Transportation Mode Distribution (Pie Chart)
-    transport_dist = df_filtered['Transportation modes'].value_counts().reset_index()
-    transport_dist.columns = ['Transportation modes', 'Count']
+    transport_dist = get_transport_dist(*filters)
     fig3 = px.pie(
         transport_dist,
         values='Count',
         names='Transportation modes',
         title='Transportation Mode Distribution',
         hole=0.4,
-        color_discrete_sequence=px.colors.qualitative.Pastel
+        color_discrete_sequence=COLORS_PASTEL
     )
     fig3.update_traces(textposition='inside', textinfo='percent+label')
-    fig3.update_layout(height=400)
+    fig3.update_layout(**LAYOUT_400)
     st.plotly_chart(fig3, use_container_width=True)
 
 with col2:
     # Shipping Costs by Route (Donut Chart)
-    shipping_by_route = df_filtered.groupby('Routes')['Shipping costs'].sum().reset_index()
+    shipping_by_route = get_shipping_by_route(*filters)
     fig4 = px.pie(
         shipping_by_route,
         values='Shipping costs',
         names='Routes',
         title='Shipping Costs by Route',
         hole=0.5,
-        color_discrete_sequence=px.colors.qualitative.Set3
+        color_discrete_sequence=COLORS_SET3
     )
     fig4.update_traces(textposition='inside', textinfo='percent+label')
-    fig4.update_layout(height=400)
+    fig4.update_layout(**LAYOUT_400)
     st.plotly_chart(fig4, use_container_width=True)
 
 with col3:
     # Average Shipping Time by Carrier (Bar Chart)
-    avg_shipping_time = df_filtered.groupby('Shipping carriers')['Shipping times'].mean().reset_index()
-    avg_shipping_time = avg_shipping_time.sort_values('Shipping times', ascending=False)
+    avg_shipping_time = get_avg_shipping_time(*filters)
+    avg_shipping_time = avg_shipping_time.astype({'Shipping carriers': str, 'Shipping times': np.float32})
     fig5 = px.bar(
         avg_shipping_time,
         x='Shipping carriers',
@@ -196,7 +487,7 @@ with col3:
         text='Shipping times'
     )
     fig5.update_traces(texttemplate='%{text:.1f} days', textposition='outside')
-    fig5.update_layout(height=400)
+    fig5.update_layout(**LAYOUT_400)
     st.plotly_chart(fig5, use_container_width=True)
 
 # Row 3: Production and Quality
@@ -205,7 +496,7 @@ col1, col2 = st.columns(2)
 
 with col1:
     # Production Volumes by Location (Stacked Bar Chart)
-    production_location = df_filtered.groupby(['Location', 'Product Type'])['Production volumes'].sum().reset_index()
+    production_location = get_production_location(*filters)
     fig6 = px.bar(
         production_location,
         x='Location',
@@ -213,18 +504,16 @@ with col1:
         color='Product Type',
         title='Production Volumes by Location & Product Type',
         barmode='stack',
-        color_discrete_sequence=px.colors.qualitative.Bold,
+        color_discrete_sequence=COLORS_BOLD,
         text='Production volumes'
     )
     fig6.update_traces(texttemplate='%{text:,}', textposition='inside')
-    fig6.update_layout(height=400)
+    fig6.update_layout(**LAYOUT_400)
     st.plotly_chart(fig6, use_container_width=True)
 
 with col2:
     # Inspection Results Distribution (Funnel Chart)
-    inspection_counts = df_filtered['Inspection results'].value_counts().reset_index()
-    inspection_counts.columns = ['Inspection results', 'Count']
-    inspection_counts = inspection_counts.sort_values('Count', ascending=False)
+    inspection_counts = get_inspection_counts(*filters)
 
     fig7 = go.Figure(go.Funnel(
         y=inspection_counts['Inspection results'],
@@ -233,7 +522,7 @@ with col2:
         textinfo="value+percent initial",
         marker=dict(color=["#28a745", "#ffc107", "#dc3545"])
     ))
-    fig7.update_layout(title='Inspection Results Funnel', height=400)
+    fig7.update_layout(title='Inspection Results Funnel', **LAYOUT_400)
     st.plotly_chart(fig7, use_container_width=True)
 
 # Row 4: Scatter and Correlation Analysis
@@ -250,9 +539,10 @@ with col1:
         size='Production volumes',
         title='Defect Rate vs Manufacturing Costs',
         hover_data=['Location', 'Supplier name'],
-        color_discrete_sequence=px.colors.qualitative.Vivid
+        color_discrete_sequence=COLORS_VIVID,
+        render_mode='webgl'
     )
-    fig8.update_layout(height=400)
+    fig8.update_layout(**LAYOUT_400)
     st.plotly_chart(fig8, use_container_width=True)
 
 with col2:
@@ -265,275 +555,272 @@ with col2:
         size='Stock levels',
         title='Lead Time vs Order Quantities',
         hover_data=['Product Type', 'Supplier name'],
-        trendline="ols",
-        color_discrete_sequence=px.colors.qualitative.Safe
+        color_discrete_sequence=COLORS_SAFE,
+        render_mode='webgl'
     )
-    fig9.update_layout(height=400)
+    location_colors = {trace.name: trace.marker.color for trace in fig9.data}
+    for location, xs, ys in get_lead_time_fits(*filters):
+        fig9.add_scatter(
+            x=xs,
+            y=ys,
+            mode='lines',
+            name=f'{location} fit',
+            line=dict(color=location_colors.get(location)),
+            legendgroup=location,
+            showlegend=False
+        )
+    fig9.update_layout(**LAYOUT_400)
     st.plotly_chart(fig9, use_container_width=True)
 
-# Row 5: Time-based Analysis
-st.header("⏱️ Lead Time Analysis")
-col1, col2 = st.columns(2)
-
-with col1:
-    # Lead Times Distribution (Histogram)
-    fig10 = px.histogram(
-        df_filtered,
-        x='Lead times',
-        nbins=20,
-        title='Lead Times Distribution',
-        color_discrete_sequence=['#636EFA'],
-        marginal='box'
-    )
-    fig10.update_layout(showlegend=False, height=400)
-    st.plotly_chart(fig10, use_container_width=True)
-
-with col2:
-    # Manufacturing Lead Time by Product Type (Box Plot)
-    fig11 = px.box(
-        df_filtered,
-        x='Product Type',
-        y='Manufacturing lead time',
-        color='Product Type',
-        title='Manufacturing Lead Time Distribution by Product Type',
-        color_discrete_sequence=px.colors.qualitative.Alphabet
-    )
-    fig11.update_layout(showlegend=False, height=400)
-    st.plotly_chart(fig11, use_container_width=True)
-
-# Row 6: Stock and Inventory Analysis
-st.header("📦 Stock & Inventory Management")
-col1, col2 = st.columns(2)
-
-with col1:
-    # Stock Levels vs Availability (Scatter with Color)
-    fig12 = px.scatter(
-        df_filtered,
-        x='Stock levels',
-        y='Availability',
-        color='Product Type',
-        size='Number of products sold',
-        title='Stock Levels vs Availability',
-        hover_data=['SKU', 'Location'],
-        color_discrete_sequence=px.colors.qualitative.Prism
-    )
-    fig12.update_layout(height=400)
-    st.plotly_chart(fig12, use_container_width=True)
-
-with col2:
-    # Top 10 Products by Revenue (Tree Map)
-    top_products = df_filtered.nlargest(10, 'Revenue generated')
-    fig13 = px.treemap(
-        top_products,
-        path=['Product Type', 'SKU'],
-        values='Revenue generated',
-        title='Top 10 Products by Revenue (TreeMap)',
-        color='Defect rates',
-        color_continuous_scale='RdYlGn_r',
-        hover_data=['Number of products sold']
-    )
-    fig13.update_layout(height=400)
-    st.plotly_chart(fig13, use_container_width=True)
-
-# Row 7: Cost Analysis
-st.header("💵 Cost Analysis")
-col1, col2 = st.columns(2)
-
-with col1:
-    # Total Costs by Transportation Mode (Sunburst Chart)
-    costs_by_transport = df_filtered.groupby(['Transportation modes', 'Routes']).agg({
-        'Costs': 'sum',
-        'Shipping costs': 'sum'
-    }).reset_index()
-
-    fig14 = px.sunburst(
-        costs_by_transport,
-        path=['Transportation modes', 'Routes'],
-        values='Costs',
-        title='Cost Breakdown by Transportation & Routes',
-        color='Costs',
-        color_continuous_scale='Blues'
-    )
-    fig14.update_layout(height=450)
-    st.plotly_chart(fig14, use_container_width=True)
-
-with col2:
-    # Cost Components Comparison (Grouped Bar Chart)
-    cost_data = pd.DataFrame({
-        'Category': ['Manufacturing', 'Shipping', 'Transportation'],
-        'Total Cost': [
-            df_filtered['Manufacturing costs'].sum(),
-            df_filtered['Shipping costs'].sum(),
-            df_filtered['Costs'].sum()
-        ]
-    })
-
-    fig15 = px.bar(
-        cost_data,
-        x='Category',
-        y='Total Cost',
-        title='Total Cost Comparison by Category',
-        color='Category',
-        color_discrete_sequence=px.colors.qualitative.Dark2,
-        text='Total Cost'
-    )
-    fig15.update_traces(texttemplate='$%{text:,.0f}', textposition='outside')
-    fig15.update_layout(showlegend=False, height=450)
-    st.plotly_chart(fig15, use_container_width=True)
-
-# Row 8: Heatmap and Advanced Visualizations
-st.header("🔥 Correlation Heatmap")
-
-# Correlation Heatmap
-numeric_cols = ['Price', 'Availability', 'Number of products sold', 'Revenue generated',
-                'Stock levels', 'Lead times', 'Order quantities', 'Shipping times',
-                'Production volumes', 'Manufacturing lead time', 'Defect rates']
-
-correlation_matrix = df_filtered[numeric_cols].corr()
-
-fig16 = px.imshow(
-    correlation_matrix,
-    labels=dict(color="Correlation"),
-    x=correlation_matrix.columns,
-    y=correlation_matrix.columns,
-    color_continuous_scale='RdBu_r',
-    aspect="auto",
-    title='Correlation Matrix of Key Metrics'
-)
-fig16.update_layout(height=600)
-st.plotly_chart(fig16, use_container_width=True)
-
-# Row 9: Multi-metric Analysis
-st.header("📊 Multi-Metric Comparison")
-col1, col2 = st.columns(2)
-
-with col1:
-    # Radar Chart for Average Metrics by Product Type
-    metrics_by_product = df_filtered.groupby('Product Type').agg({
-        'Price': 'mean',
-        'Stock levels': 'mean',
-        'Lead times': 'mean',
-        'Defect rates': 'mean',
-        'Shipping times': 'mean'
-    }).reset_index()
-
-    # Normalize values for radar chart
-    for col in ['Price', 'Stock levels', 'Lead times', 'Defect rates', 'Shipping times']:
-        metrics_by_product[col] = (metrics_by_product[col] - metrics_by_product[col].min()) / (metrics_by_product[col].max() - metrics_by_product[col].min()) * 100
-
-    fig17 = go.Figure()
-
-    for idx, product in enumerate(metrics_by_product['Product Type'].unique()):
-        product_data = metrics_by_product[metrics_by_product['Product Type'] == product]
-        fig17.add_trace(go.Scatterpolar(
-            r=product_data[['Price', 'Stock levels', 'Lead times', 'Defect rates', 'Shipping times']].values[0],
-            theta=['Price', 'Stock levels', 'Lead times', 'Defect rates', 'Shipping times'],
-            fill='toself',
-            name=product
-        ))
-
-    fig17.update_layout(
-        polar=dict(radialaxis=dict(visible=True, range=[0, 100])),
-        title='Product Type Performance Radar',
-        height=450
-    )
-    st.plotly_chart(fig17, use_container_width=True)
-
-with col2:
-    # Revenue and Defect Rate by Supplier (Bubble Chart)
-    supplier_metrics = df_filtered.groupby('Supplier name').agg({
-        'Revenue generated': 'sum',
-        'Defect rates': 'mean',
-        'Number of products sold': 'sum'
-    }).reset_index()
-
-    fig18 = px.scatter(
-        supplier_metrics,
-        x='Revenue generated',
-        y='Defect rates',
-        size='Number of products sold',
-        color='Supplier name',
-        title='Supplier Performance: Revenue vs Defect Rate',
-        hover_data=['Supplier name'],
-        size_max=60
-    )
-    fig18.update_layout(height=450, showlegend=False)
-    st.plotly_chart(fig18, use_container_width=True)
-
-# Row 10: Demographics and Customer Insights
-st.header("👥 Customer Demographics")
-col1, col2 = st.columns(2)
-
-with col1:
-    # Customer Demographics Distribution
-    demographics_dist = df_filtered['Customer demographics'].value_counts().reset_index()
-    demographics_dist.columns = ['Demographics', 'Count']
-
-    fig19 = px.bar(
-        demographics_dist,
-        x='Demographics',
-        y='Count',
-        title='Customer Demographics Distribution',
-        color='Demographics',
-        color_discrete_sequence=px.colors.qualitative.Pastel1,
-        text='Count'
-    )
-    fig19.update_traces(textposition='outside')
-    fig19.update_layout(showlegend=False, height=400)
-    st.plotly_chart(fig19, use_container_width=True)
-
-with col2:
-    # Revenue by Demographics
-    revenue_demographics = df_filtered.groupby('Customer demographics')['Revenue generated'].sum().reset_index()
-
-    fig20 = px.pie(
-        revenue_demographics,
-        values='Revenue generated',
-        names='Customer demographics',
-        title='Revenue Distribution by Customer Demographics',
-        hole=0.3,
-        color_discrete_sequence=px.colors.qualitative.Set1
+# Below-the-fold sections: only the selected one builds its figures
+SECTIONS = ["⏱️ Lead Time & Inventory", "💵 Costs", "🔥 Correlations & Multi-Metric", "👥 Customers"]
+selected_section = st.radio("Detailed Analysis", SECTIONS, horizontal=True)
+
+if selected_section == SECTIONS[0]:
+    # Row 5: Time-based Analysis
+    st.header("⏱️ Lead Time Analysis")
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Lead Times Distribution (Histogram)
+        fig10 = px.histogram(
+            df_filtered,
+            x='Lead times',
+            nbins=20,
+            title='Lead Times Distribution',
+            color_discrete_sequence=['#636EFA'],
+            marginal='box'
+        )
+        fig10.update_layout(**LAYOUT_400_NO_LEGEND)
+        st.plotly_chart(fig10, use_container_width=True)
+
+    with col2:
+        # Manufacturing Lead Time by Product Type (Box Plot)
+        fig11 = px.box(
+            df_filtered,
+            x='Product Type',
+            y='Manufacturing lead time',
+            color='Product Type',
+            title='Manufacturing Lead Time Distribution by Product Type',
+            color_discrete_sequence=COLORS_ALPHABET
+        )
+        fig11.update_layout(**LAYOUT_400_NO_LEGEND)
+        st.plotly_chart(fig11, use_container_width=True)
+
+    # Row 6: Stock and Inventory Analysis
+    st.header("📦 Stock & Inventory Management")
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Stock Levels vs Availability (Scatter with Color)
+        fig12 = px.scatter(
+            df_filtered,
+            x='Stock levels',
+            y='Availability',
+            color='Product Type',
+            size='Number of products sold',
+            title='Stock Levels vs Availability',
+            hover_data=['SKU', 'Location'],
+            color_discrete_sequence=COLORS_PRISM,
+            render_mode='webgl'
+        )
+        fig12.update_layout(**LAYOUT_400)
+        st.plotly_chart(fig12, use_container_width=True)
+
+    with col2:
+        # Top 10 Products by Revenue (Tree Map)
+        top_products = get_top_products(*filters)
+        fig13 = px.treemap(
+            top_products,
+            path=['Product Type', 'SKU'],
+            values='Revenue generated',
+            title='Top 10 Products by Revenue (TreeMap)',
+            color='Defect rates',
+            color_continuous_scale='RdYlGn_r',
+            hover_data=['Number of products sold']
+        )
+        fig13.update_layout(**LAYOUT_400)
+        st.plotly_chart(fig13, use_container_width=True)
+
+if selected_section == SECTIONS[1]:
+    # Row 7: Cost Analysis
+    st.header("💵 Cost Analysis")
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Total Costs by Transportation Mode (Sunburst Chart)
+        costs_by_transport = get_costs_by_transport(*filters)
+
+        fig14 = px.sunburst(
+            costs_by_transport,
+            path=['Transportation modes', 'Routes'],
+            values='Costs',
+            title='Cost Breakdown by Transportation & Routes',
+            color='Costs',
+            color_continuous_scale='Blues'
+        )
+        fig14.update_layout(**LAYOUT_450)
+        st.plotly_chart(fig14, use_container_width=True)
+
+    with col2:
+        # Cost Components Comparison (Grouped Bar Chart)
+        cost_data = get_cost_data(*filters)
+
+        fig15 = px.bar(
+            cost_data,
+            x='Category',
+            y='Total Cost',
+            title='Total Cost Comparison by Category',
+            color='Category',
+            color_discrete_sequence=COLORS_DARK2,
+            text='Total Cost'
+        )
+        fig15.update_traces(texttemplate='$%{text:,.0f}', textposition='outside')
+        fig15.update_layout(**LAYOUT_450_NO_LEGEND)
+        st.plotly_chart(fig15, use_container_width=True)
+
+if selected_section == SECTIONS[2]:
+    # Row 8: Heatmap and Advanced Visualizations
+    st.header("🔥 Correlation Heatmap")
+
+    # Correlation Heatmap
+    correlation_matrix = get_correlation_matrix(*filters)
+
+    fig16 = px.imshow(
+        correlation_matrix,
+        labels=dict(color="Correlation"),
+        x=NUMERIC_COLS,
+        y=NUMERIC_COLS,
+        color_continuous_scale='RdBu_r',
+        aspect="auto",
+        title='Correlation Matrix of Key Metrics'
     )
-    fig20.update_traces(textposition='inside', textinfo='percent+label')
-    fig20.update_layout(height=400)
-    st.plotly_chart(fig20, use_container_width=True)
+    fig16.update_layout(height=600)
+    st.plotly_chart(fig16, use_container_width=True)
+
+    # Row 9: Multi-metric Analysis
+    st.header("📊 Multi-Metric Comparison")
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Radar Chart for Average Metrics by Product Type
+        metrics_by_product = get_metrics_by_product(*filters)
+
+        fig17 = go.Figure()
+
+        radar_values = metrics_by_product[RADAR_COLS].to_numpy()
+        for idx, product in enumerate(metrics_by_product['Product Type']):
+            fig17.add_trace(go.Scatterpolar(
+                r=radar_values[idx],
+                theta=RADAR_COLS,
+                fill='toself',
+                name=product
+            ))
+
+        fig17.update_layout(
+            polar=dict(radialaxis=dict(visible=True, range=[0, 100])),
+            title='Product Type Performance Radar',
+            height=450
+        )
+        st.plotly_chart(fig17, use_container_width=True)
+
+    with col2:
+        # Revenue and Defect Rate by Supplier (Bubble Chart)
+        supplier_metrics = get_supplier_metrics(*filters)
+
+        fig18 = px.scatter(
+            supplier_metrics,
+            x='Revenue generated',
+            y='Defect rates',
+            size='Number of products sold',
+            color='Supplier name',
+            title='Supplier Performance: Revenue vs Defect Rate',
+            hover_data=['Supplier name'],
+            size_max=60
+        )
+        fig18.update_layout(**LAYOUT_450_NO_LEGEND)
+        st.plotly_chart(fig18, use_container_width=True)
+
+if selected_section == SECTIONS[3]:
+    # Row 10: Demographics and Customer Insights
+    st.header("👥 Customer Demographics")
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Customer Demographics Distribution
+        demographics_dist = get_demographics_dist(*filters)
+
+        demographics_dist = demographics_dist.astype({'Demographics': str})
+        fig19 = px.bar(
+            demographics_dist,
+            x='Demographics',
+            y='Count',
+            title='Customer Demographics Distribution',
+            color='Demographics',
+            color_discrete_sequence=COLORS_PASTEL1,
+            text='Count'
+        )
+        fig19.update_traces(textposition='outside')
+        fig19.update_layout(**LAYOUT_400_NO_LEGEND)
+        st.plotly_chart(fig19, use_container_width=True)
+
+    with col2:
+        # Revenue by Demographics
+        revenue_demographics = get_revenue_demographics(*filters)
+
+        fig20 = px.pie(
+            revenue_demographics,
+            values='Revenue generated',
+            names='Customer demographics',
+            title='Revenue Distribution by Customer Demographics',
+            hole=0.3,
+            color_discrete_sequence=COLORS_SET1
+        )
+        fig20.update_traces(textposition='inside', textinfo='percent+label')
+        fig20.update_layout(**LAYOUT_400)
+        st.plotly_chart(fig20, use_container_width=True)
 
 # Data Table
 st.header("📋 Detailed Data Table")
+TABLE_MAX_ROWS = 1000
 st.dataframe(
-    df_filtered.style.format({
-        'Price': '${:.2f}',
-        'Revenue generated': '${:,.2f}',
-        'Shipping costs': '${:.2f}',
-        'Manufacturing costs': '${:.2f}',
-        'Costs': '${:.2f}',
-        'Defect rates': '{:.2f}%'
-    }),
+    df_filtered.head(TABLE_MAX_ROWS),
+    column_config={
+        'Price': st.column_config.NumberColumn(format='dollar'),
+        'Revenue generated': st.column_config.NumberColumn(format='dollar'),
+        'Shipping costs': st.column_config.NumberColumn(format='dollar'),
+        'Manufacturing costs': st.column_config.NumberColumn(format='dollar'),
+        'Costs': st.column_config.NumberColumn(format='dollar'),
+        'Defect rates': st.column_config.NumberColumn(format='%.2f%%')
+    },
     use_container_width=True,
     height=400
 )
+if len(df_filtered) > TABLE_MAX_ROWS:
+    st.caption(f"Showing the first {TABLE_MAX_ROWS:,} of {len(df_filtered):,} rows")
 
 # Summary Statistics
 st.header("📊 Summary Statistics")
 col1, col2, col3 = st.columns(3)
+summary = compute_summary(*filters)
 
 with col1:
     st.subheader("Revenue Metrics")
-    st.write(f"**Total Revenue:** ${df_filtered['Revenue generated'].sum():,.2f}")
-    st.write(f"**Average Revenue:** ${df_filtered['Revenue generated'].mean():,.2f}")
-    st.write(f"**Max Revenue:** ${df_filtered['Revenue generated'].max():,.2f}")
+    st.write(f"**Total Revenue:** ${summary.sums[col_idx['Revenue generated']]:,.2f}")
+    st.write(f"**Average Revenue:** ${summary.means[col_idx['Revenue generated']]:,.2f}")
+    st.write(f"**Max Revenue:** ${summary.maxs[col_idx['Revenue generated']]:,.2f}")
 
 with col2:
     st.subheader("Quality Metrics")
-    st.write(f"**Average Defect Rate:** {df_filtered['Defect rates'].mean():.2f}%")
-    st.write(f"**Pass Rate:** {(df_filtered['Inspection results'] == 'Pass').sum() / len(df_filtered) * 100:.1f}%")
-    st.write(f"**Fail Rate:** {(df_filtered['Inspection results'] == 'Fail').sum() / len(df_filtered) * 100:.1f}%")
+    st.write(f"**Average Defect Rate:** {summary.means[col_idx['Defect rates']]:.2f}%")
+    st.write(f"**Pass Rate:** {summary.pass_rate:.1f}%")
+    st.write(f"**Fail Rate:** {summary.fail_rate:.1f}%")
 
 with col3:
     st.subheader("Operational Metrics")
-    st.write(f"**Average Lead Time:** {df_filtered['Lead times'].mean():.1f} days")
-    st.write(f"**Total Stock:** {df_filtered['Stock levels'].sum():,} units")
-    st.write(f"**Total Products Sold:** {df_filtered['Number of products sold'].sum():,}")
+    st.write(f"**Average Lead Time:** {summary.means[col_idx['Lead times']]:.1f} days")
+    st.write(f"**Total Stock:** {int(summary.sums[col_idx['Stock levels']]):,} units")
+    st.write(f"**Total Products Sold:** {int(summary.sums[col_idx['Number of products sold']]):,}")
 
 st.markdown("---")
 st.markdown("**Dashboard created with Streamlit & Plotly** | Data updated: Feb 2026")
\ No newline at end of file